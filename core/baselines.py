@@ -81,8 +81,8 @@ def simplify_pack(pack, folder):
         return False
     log.i('Simplifying {}: {}'.format(folder, pack))
     packdir = paths.get(folder, pack)
-    files_before = sum(len(f) for _, _, f in os.walk(packdir))
-    if files_before == 0:
+    # any() stops the walk at the first dir that contains a file
+    if not any(files for _, _, files in os.walk(packdir)):
         return None
     keep = [('raw',), ('data', 'speech')]
     if folder == 'graphics':
@@ -94,6 +94,7 @@ def simplify_pack(pack, folder):
     if folder == 'baselines':
         keep.append(('data', 'init', 'interface.txt'))
     keep = [os.path.join(*k) for k in keep]
+    removed = 0
     for root, _, files in os.walk(packdir):
         for k in files:
             if k == 'manifest.json' or 'readme' in k.lower():
@@ -102,9 +103,9 @@ def simplify_pack(pack, folder):
             if not any(fnmatch.fnmatch(f, os.path.join(packdir, pattern, '*'))
                        for pattern in keep):
                 os.remove(f)
-    files_after = sum(len(f) for _, _, f in os.walk(packdir))
-    log.v('Removed {} files'.format(files_before - files_after))
-    return files_before - files_after
+                removed += 1
+    log.v('Removed {} files'.format(removed))
+    return removed
 
 def remove_vanilla_raws_from_pack(pack, folder):
     """Remove files identical to vanilla raws, return files removed
@@ -7,14 +7,13 @@ import sys, os, shutil, re
 import struct
 import zlib
 from datetime import datetime
-from distutils import dir_util
 from glob import glob
 from functools import total_ordering
 # pylint:disable=redefined-builtin
 from io import open
 
 from .settings import DFConfiguration
-from . import hacks, paths, log
+from . import hacks, helpers, paths, log
 from .lnp import lnp, VERSION
 
 def find_df_folders():
@@ -100,7 +99,7 @@ def install_extras():
     install_file = paths.get('df', 'PyLNP{0}.txt'.format(VERSION))
     if not os.access(install_file, os.F_OK):
         log.i('Installing extras content for first time')
-        dir_util.copy_tree(extras_dir, paths.get('df'))
+        helpers.fast_copytree(extras_dir, paths.get('df'))
         textfile = open(install_file, 'w', encoding='utf-8')
         textfile.write(
             'PyLNP V{0} extras installed!\nTime: {1}'.format(
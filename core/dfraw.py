@@ -51,6 +51,9 @@ init_filename_parents = {
 # Do not allow parent tags to go under these tags
 final_level_tags = ['TILE_PAGE']
 
+# Disabled tags look like !TAG!; compiled once instead of per token
+disabled_tag_pattern = re.compile('!\\w+!')
+
 def tokenize_raw(text):
     """Generator which returns nodes from a raw file.
 
@@ -69,7 +72,7 @@ def tokenize_raw(text):
             curr_string = text[:text.find(']')+1]
             node_type = 'Tag'
         if text[0] == '!':
-            match = re.match('!\\w+!', text)
+            match = disabled_tag_pattern.match(text)
             if match:
                 curr_string = match.group()
                 node_type = 'Tag'
@@ -79,7 +82,7 @@ def tokenize_raw(text):
             else:
                 curr_string = text
             #check for
-            match = re.search('!\\w+!', text)
+            match = disabled_tag_pattern.search(text)
             if match:
                 curr_string = curr_string[:match.start()]
             node_type = 'Comment'
@@ -356,9 +359,18 @@ class DFRaw(DFRawNode):
 
     @classmethod
     def read(cls, path):
-        """Returns the contents of the raw file at <path>."""
-        with cls.open(path, 'rt') as fd:
-            return fd.read()
+        """Returns the contents of the raw file at <path>.
+
+        Reads the raw bytes and decodes them in one step; cp437 is a 1:1
+        byte map, so this skips the incremental decoder a text-mode open
+        would layer over the whole file."""
+        with io.open(path, 'rb') as fd:
+            data = fd.read()
+        text = data.decode('cp437', 'replace')
+        if '\r' in text:
+            # Match the universal-newline behaviour of text mode
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        return text
 
     @classmethod
     def write(cls, path, text):
@@ -3,10 +3,11 @@
 """Graphics pack management."""
 from __future__ import print_function, unicode_literals, absolute_import
 
-import os, shutil, glob
+import os, shutil, glob, threading
+from concurrent.futures import ThreadPoolExecutor
 from .launcher import open_file
 from .lnp import lnp
-from . import colors, df, paths, baselines, mods, log, manifest
+from . import colors, df, paths, baselines, helpers, mods, log, manifest
 from .dfraw import DFRaw
 
 def open_graphics():
@@ -42,41 +43,98 @@ def current_pack():
         if p:
             log.i('Read installed graphics ({}) from log'.format(p))
             return p
-    packs = read_graphics()
-    for p in packs:
-        if (lnp.settings.FONT == p[1] and
-                lnp.settings.GRAPHICS_FONT == p[2]):
-            log.i('Installed graphics is {} by checking tilesets'.format(p[0]))
-            return p[0]
+    read_graphics()
+    font = lnp.settings.FONT
+    graphics_font = None
+    if lnp.settings.version_has_option('GRAPHICS_FONT'):
+        graphics_font = lnp.settings.GRAPHICS_FONT
+    p = _packs_cache['index'].get((font, graphics_font))
+    if p:
+        log.i('Installed graphics is {} by checking tilesets'.format(p))
+        return p
     result = str(lnp.settings.FONT)
     if lnp.settings.version_has_option('GRAPHICS_FONT'):
         result += '/'+str(lnp.settings.GRAPHICS_FONT)
     log.w('Could not determine installed graphics, tileset is ' + result)
     return result
 
+# logged_graphics results, keyed on (logfile, start): (mtime, pack)
+_logged_cache = {}
+
 def logged_graphics(logfile, start='graphics/'):
     """Returns the graphics pack from an 'installed_raws.txt' file"""
-    if os.path.isfile(logfile):
-        with open(logfile) as f:
-            for l in f.readlines():
-                if l.startswith(start):
-                    return l.strip().replace(start, '')
-    return ''
+    if not os.path.isfile(logfile):
+        return ''
+    mtime = os.path.getmtime(logfile)
+    cached = _logged_cache.get((logfile, start))
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    result = ''
+    with open(logfile) as f:
+        for l in f:
+            if l.startswith(start):
+                result = l.strip().replace(start, '')
+                break
+    _logged_cache[(logfile, start)] = (mtime, result)
+    return result
+
+# Tilesets from each pack's init.txt, keyed on path: (mtime, (font, graphics))
+_tileset_cache = {}
+
+def _pack_tilesets(init_path):
+    """Returns (FONT, GRAPHICS_FONT) from a pack's init.txt. The parse is
+    cached on the file's modification time, so repeated pack listings only
+    read each init.txt once."""
+    mtime = os.path.getmtime(init_path)
+    cached = _tileset_cache.get(init_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    #pylint: disable=unbalanced-tuple-unpacking
+    font, graphics = DFRaw(init_path).get_values('FONT', 'GRAPHICS_FONT')
+    _tileset_cache[init_path] = (mtime, (font, graphics))
+    return font, graphics
+
+# Memoized read_graphics result and a (FONT, GRAPHICS_FONT) -> pack index,
+# keyed on the graphics dir mtime, each pack's init.txt mtime and the DF
+# version, so adding or removing packs, editing a pack's tilesets in place,
+# or switching DF folders all invalidate it.
+_packs_cache = {'key': None, 'packs': None, 'index': None}
+
+def list_pack_names():
+    """Yields the compatible graphics pack dirs, without parsing their init
+    files.  scandir's DirEntry caches is_dir(), avoiding a stat per entry."""
+    for e in os.scandir(paths.get('graphics')):
+        if (e.is_dir(follow_symlinks=False) and
+                manifest.is_compatible('graphics', e.name)):
+            yield e.name
 
 def read_graphics():
     """Returns a list of tuples of (graphics dir, FONT, GRAPHICS_FONT)."""
-    packs = [os.path.basename(o) for o in
-             glob.glob(paths.get('graphics', '*')) if os.path.isdir(o)
-             and manifest.is_compatible('graphics', os.path.basename(o))]
+    packs = sorted(list_pack_names())
+    inits = []
+    for p in packs:
+        try:
+            inits.append(os.stat(paths.get(
+                'graphics', p, 'data', 'init', 'init.txt')).st_mtime_ns)
+        except OSError:
+            inits.append(None)
+    key = (os.stat(paths.get('graphics')).st_mtime_ns,
+           tuple(inits), str(lnp.df_info.version))
+    if _packs_cache['key'] == key:
+        return _packs_cache['packs']
     result = []
     for p in packs:
         if not validate_pack(p):
             continue
         init_path = paths.get('graphics', p, 'data', 'init', 'init.txt')
-        #pylint: disable=unbalanced-tuple-unpacking
-        font, graphics = DFRaw(init_path).get_values('FONT', 'GRAPHICS_FONT')
+        font, graphics = _pack_tilesets(init_path)
         result.append((p, font, graphics))
-    return tuple(sorted(result))
+    result = tuple(sorted(result))
+    index = {}
+    for p in result:
+        index.setdefault((p[1], p[2]), p[0])
+    _packs_cache.update(key=key, packs=result, index=index)
+    return result
 
 def add_tilesets():
     """Copies missing tilesets from LNP/Tilesets to the data/art folder."""
@@ -87,6 +145,33 @@ def add_tilesets():
             else:
                 shutil.copytree(item, paths.get('data', 'art'))
 
+def _manifest(root):
+    """Maps each file under <root> to its (size, mtime), using the stat
+    results cached on the scandir entries."""
+    result = {}
+    stack = ['']
+    while stack:
+        rel = stack.pop()
+        with os.scandir(os.path.join(root, rel)) as it:
+            for e in it:
+                e_rel = os.path.join(rel, e.name)
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e_rel)
+                else:
+                    st = e.stat()
+                    result[e_rel] = (st.st_size, int(st.st_mtime))
+    return result
+
+def _art_is_current(src, dst):
+    """Returns True if every art file in <src> is already present in <dst>
+    with matching size and mtime.  copy2 preserves both, so reinstalling the
+    same pack hits this zero-IO fast path; extra files in <dst> (tilesets,
+    mouse.png etc.) are ones installation would re-add anyway."""
+    if not os.path.isdir(src) or not os.path.isdir(dst):
+        return False
+    dst_files = _manifest(dst)
+    return all(dst_files.get(f) == v for f, v in _manifest(src).items())
+
 def install_graphics(pack):
     """Installs the graphics pack located in LNP/Graphics/<pack>.
 
@@ -95,26 +180,43 @@ def install_graphics(pack):
 
     Returns:
         True if successful,
-        False if an exception occured
+        False if an exception occured,
+        0 if the raw update was aborted,
         None if baseline vanilla raws are missing
     """
-    # pylint:disable=too-many-branches
+    # pylint:disable=too-many-branches,too-many-locals,too-many-statements
     if not baselines.find_vanilla_raws():
         log.w('Cannot install graphics when baseline raws are missing!')
         return None
     try:
-        # Update raws
+        # Update raws; nothing has been touched yet if this aborts, so
+        # there is no need to re-read settings on this path.  The UI
+        # distinguishes 0 (raws not updatable) from False (install error).
         if not update_graphics_raws(paths.get('df', 'raw'), pack):
             return 0
         # Backup TwbT-specific art files
+        # copyfile copies data only, via the OS zero-copy path where possible
         for item in ('white1px.png', 'transparent1px.png'):
             if os.path.exists(paths.get('data', 'art', item)):
-                shutil.copy(paths.get('data', 'art', item),
-                            paths.get('graphics', pack, 'data', 'art'))
-        # Copy art
-        shutil.rmtree(paths.get('data', 'art'))
-        shutil.copytree(paths.get('graphics', pack, 'data', 'art'),
-                        paths.get('data', 'art'))
+                shutil.copyfile(
+                    paths.get('data', 'art', item),
+                    paths.get('graphics', pack, 'data', 'art', item))
+        # Copy art, unless the pack's art files are all installed already
+        art_src = paths.get('graphics', pack, 'data', 'art')
+        art_dst = paths.get('data', 'art')
+        if not _art_is_current(art_src, art_dst):
+            # Rename the old art dir aside and delete it in the background;
+            # the copy only needs the name free, not the deletion done.
+            old_art = art_dst + '.old'
+            if os.path.isdir(old_art):
+                shutil.rmtree(old_art, ignore_errors=True)
+            os.rename(art_dst, old_art)
+            remover = threading.Thread(
+                target=shutil.rmtree, args=(old_art,),
+                kwargs={'ignore_errors': True})
+            remover.start()
+            helpers.fast_copytree(art_src, art_dst)
+            remover.join()
         add_tilesets()
         # ensure that mouse.png and font.ttf exist (required by DF)
         base = baselines.find_vanilla()
@@ -145,18 +247,14 @@ def install_graphics(pack):
                                         '_Current graphics pack.txt')):
                 os.remove(paths.get('colors', '_Current graphics pack.txt'))
 
-        # TwbT overrides
-        #pylint: disable=bare-except
-        try:
-            os.remove(paths.get('init', 'overrides.txt'))
-        except:
-            pass
-        try:
-            shutil.copyfile(
-                paths.get('graphics', pack, 'data', 'init', 'overrides.txt'),
-                paths.get('init', 'overrides.txt'))
-        except:
-            pass
+        # TwbT overrides; not all packs ship one
+        overrides_src = paths.get(
+            'graphics', pack, 'data', 'init', 'overrides.txt')
+        overrides_dst = paths.get('init', 'overrides.txt')
+        if os.path.isfile(overrides_dst):
+            os.remove(overrides_dst)
+        if os.path.isfile(overrides_src):
+            shutil.copyfile(overrides_src, overrides_dst)
 
         # TwbT file replacements
         if 'TWBT' in lnp.settings.printmode:
@@ -196,87 +294,98 @@ def validate_pack(pack, df_version=None):
             gfx_dir, 'data', 'init', 'colors.txt'))
     return result
 
+# Fields overwritten from a graphics pack's init files; frozen at module
+# scope so patch_inits doesn't rebuild ~160 strings per install
+_D_INIT_FIELDS = (
+    'WOUND_COLOR_NONE', 'WOUND_COLOR_MINOR',
+    'WOUND_COLOR_INHIBITED', 'WOUND_COLOR_FUNCTION_LOSS',
+    'WOUND_COLOR_BROKEN', 'WOUND_COLOR_MISSING', 'SKY', 'CHASM',
+    'PILLAR_TILE', 'VARIED_GROUND_TILES', 'ENGRAVINGS_START_OBSCURED',
+    # Tracks
+    'TRACK_N', 'TRACK_S', 'TRACK_E', 'TRACK_W', 'TRACK_NS',
+    'TRACK_NE', 'TRACK_NW', 'TRACK_SE', 'TRACK_SW', 'TRACK_EW',
+    'TRACK_NSE', 'TRACK_NSW', 'TRACK_NEW', 'TRACK_SEW',
+    'TRACK_NSEW', 'TRACK_RAMP_N', 'TRACK_RAMP_S', 'TRACK_RAMP_E',
+    'TRACK_RAMP_W', 'TRACK_RAMP_NS', 'TRACK_RAMP_NE',
+    'TRACK_RAMP_NW', 'TRACK_RAMP_SE', 'TRACK_RAMP_SW',
+    'TRACK_RAMP_EW', 'TRACK_RAMP_NSE', 'TRACK_RAMP_NSW',
+    'TRACK_RAMP_NEW', 'TRACK_RAMP_SEW', 'TRACK_RAMP_NSEW',
+    # Trees
+    'TREE_ROOT_SLOPING', 'TREE_TRUNK_SLOPING',
+    'TREE_ROOT_SLOPING_DEAD', 'TREE_TRUNK_SLOPING_DEAD',
+    'TREE_ROOTS', 'TREE_ROOTS_DEAD', 'TREE_BRANCHES',
+    'TREE_BRANCHES_DEAD', 'TREE_SMOOTH_BRANCHES',
+    'TREE_SMOOTH_BRANCHES_DEAD', 'TREE_TRUNK_PILLAR',
+    'TREE_TRUNK_PILLAR_DEAD', 'TREE_CAP_PILLAR',
+    'TREE_CAP_PILLAR_DEAD', 'TREE_TRUNK_N', 'TREE_TRUNK_S',
+    'TREE_TRUNK_N_DEAD', 'TREE_TRUNK_S_DEAD', 'TREE_TRUNK_EW',
+    'TREE_TRUNK_EW_DEAD', 'TREE_CAP_WALL_N', 'TREE_CAP_WALL_S',
+    'TREE_CAP_WALL_N_DEAD', 'TREE_CAP_WALL_S_DEAD', 'TREE_TRUNK_E',
+    'TREE_TRUNK_W', 'TREE_TRUNK_E_DEAD', 'TREE_TRUNK_W_DEAD',
+    'TREE_TRUNK_NS', 'TREE_TRUNK_NS_DEAD', 'TREE_CAP_WALL_E',
+    'TREE_CAP_WALL_W', 'TREE_CAP_WALL_E_DEAD',
+    'TREE_CAP_WALL_W_DEAD', 'TREE_TRUNK_NW', 'TREE_CAP_WALL_NW',
+    'TREE_TRUNK_NW_DEAD', 'TREE_CAP_WALL_NW_DEAD', 'TREE_TRUNK_NE',
+    'TREE_CAP_WALL_NE', 'TREE_TRUNK_NE_DEAD',
+    'TREE_CAP_WALL_NE_DEAD', 'TREE_TRUNK_SW', 'TREE_CAP_WALL_SW',
+    'TREE_TRUNK_SW_DEAD', 'TREE_CAP_WALL_SW_DEAD', 'TREE_TRUNK_SE',
+    'TREE_CAP_WALL_SE', 'TREE_TRUNK_SE_DEAD',
+    'TREE_CAP_WALL_SE_DEAD', 'TREE_TRUNK_NSE',
+    'TREE_TRUNK_NSE_DEAD', 'TREE_TRUNK_NSW', 'TREE_TRUNK_NSW_DEAD',
+    'TREE_TRUNK_NEW', 'TREE_TRUNK_NEW_DEAD', 'TREE_TRUNK_SEW',
+    'TREE_TRUNK_SEW_DEAD', 'TREE_TRUNK_NSEW',
+    'TREE_TRUNK_NSEW_DEAD', 'TREE_TRUNK_BRANCH_N',
+    'TREE_TRUNK_BRANCH_N_DEAD', 'TREE_TRUNK_BRANCH_S',
+    'TREE_TRUNK_BRANCH_S_DEAD', 'TREE_TRUNK_BRANCH_E',
+    'TREE_TRUNK_BRANCH_E_DEAD', 'TREE_TRUNK_BRANCH_W',
+    'TREE_TRUNK_BRANCH_W_DEAD', 'TREE_BRANCH_NS',
+    'TREE_BRANCH_NS_DEAD', 'TREE_BRANCH_EW', 'TREE_BRANCH_EW_DEAD',
+    'TREE_BRANCH_NW', 'TREE_BRANCH_NW_DEAD', 'TREE_BRANCH_NE',
+    'TREE_BRANCH_NE_DEAD', 'TREE_BRANCH_SW', 'TREE_BRANCH_SW_DEAD',
+    'TREE_BRANCH_SE', 'TREE_BRANCH_SE_DEAD', 'TREE_BRANCH_NSE',
+    'TREE_BRANCH_NSE_DEAD', 'TREE_BRANCH_NSW',
+    'TREE_BRANCH_NSW_DEAD', 'TREE_BRANCH_NEW',
+    'TREE_BRANCH_NEW_DEAD', 'TREE_BRANCH_SEW',
+    'TREE_BRANCH_SEW_DEAD', 'TREE_BRANCH_NSEW',
+    'TREE_BRANCH_NSEW_DEAD', 'TREE_TWIGS', 'TREE_TWIGS_DEAD',
+    'TREE_CAP_RAMP', 'TREE_CAP_RAMP_DEAD', 'TREE_CAP_FLOOR1',
+    'TREE_CAP_FLOOR2', 'TREE_CAP_FLOOR1_DEAD',
+    'TREE_CAP_FLOOR2_DEAD', 'TREE_CAP_FLOOR3', 'TREE_CAP_FLOOR4',
+    'TREE_CAP_FLOOR3_DEAD', 'TREE_CAP_FLOOR4_DEAD',
+    'TREE_TRUNK_INTERIOR', 'TREE_TRUNK_INTERIOR_DEAD')
+
+_INIT_FIELDS = (
+    'FONT', 'FULLFONT', 'GRAPHICS', 'GRAPHICS_FONT',
+    'GRAPHICS_FULLFONT', 'TRUETYPE', 'PRINT_MODE',
+    'GRAPHICS_BLACK_SPACE', 'TEXTURE_PARAM', 'MOUSE_PICTURE')
+
 def patch_inits(gfx_dir):
     """Installs init files from a graphics pack by selectively changing
     specific fields. All settings but the mentioned fields are preserved.
     """
-    d_init_fields = [
-        'WOUND_COLOR_NONE', 'WOUND_COLOR_MINOR',
-        'WOUND_COLOR_INHIBITED', 'WOUND_COLOR_FUNCTION_LOSS',
-        'WOUND_COLOR_BROKEN', 'WOUND_COLOR_MISSING', 'SKY', 'CHASM',
-        'PILLAR_TILE', 'VARIED_GROUND_TILES', 'ENGRAVINGS_START_OBSCURED',
-        # Tracks
-        'TRACK_N', 'TRACK_S', 'TRACK_E', 'TRACK_W', 'TRACK_NS',
-        'TRACK_NE', 'TRACK_NW', 'TRACK_SE', 'TRACK_SW', 'TRACK_EW',
-        'TRACK_NSE', 'TRACK_NSW', 'TRACK_NEW', 'TRACK_SEW',
-        'TRACK_NSEW', 'TRACK_RAMP_N', 'TRACK_RAMP_S', 'TRACK_RAMP_E',
-        'TRACK_RAMP_W', 'TRACK_RAMP_NS', 'TRACK_RAMP_NE',
-        'TRACK_RAMP_NW', 'TRACK_RAMP_SE', 'TRACK_RAMP_SW',
-        'TRACK_RAMP_EW', 'TRACK_RAMP_NSE', 'TRACK_RAMP_NSW',
-        'TRACK_RAMP_NEW', 'TRACK_RAMP_SEW', 'TRACK_RAMP_NSEW',
-        # Trees
-        'TREE_ROOT_SLOPING', 'TREE_TRUNK_SLOPING',
-        'TREE_ROOT_SLOPING_DEAD', 'TREE_TRUNK_SLOPING_DEAD',
-        'TREE_ROOTS', 'TREE_ROOTS_DEAD', 'TREE_BRANCHES',
-        'TREE_BRANCHES_DEAD', 'TREE_SMOOTH_BRANCHES',
-        'TREE_SMOOTH_BRANCHES_DEAD', 'TREE_TRUNK_PILLAR',
-        'TREE_TRUNK_PILLAR_DEAD', 'TREE_CAP_PILLAR',
-        'TREE_CAP_PILLAR_DEAD', 'TREE_TRUNK_N', 'TREE_TRUNK_S',
-        'TREE_TRUNK_N_DEAD', 'TREE_TRUNK_S_DEAD', 'TREE_TRUNK_EW',
-        'TREE_TRUNK_EW_DEAD', 'TREE_CAP_WALL_N', 'TREE_CAP_WALL_S',
-        'TREE_CAP_WALL_N_DEAD', 'TREE_CAP_WALL_S_DEAD', 'TREE_TRUNK_E',
-        'TREE_TRUNK_W', 'TREE_TRUNK_E_DEAD', 'TREE_TRUNK_W_DEAD',
-        'TREE_TRUNK_NS', 'TREE_TRUNK_NS_DEAD', 'TREE_CAP_WALL_E',
-        'TREE_CAP_WALL_W', 'TREE_CAP_WALL_E_DEAD',
-        'TREE_CAP_WALL_W_DEAD', 'TREE_TRUNK_NW', 'TREE_CAP_WALL_NW',
-        'TREE_TRUNK_NW_DEAD', 'TREE_CAP_WALL_NW_DEAD', 'TREE_TRUNK_NE',
-        'TREE_CAP_WALL_NE', 'TREE_TRUNK_NE_DEAD',
-        'TREE_CAP_WALL_NE_DEAD', 'TREE_TRUNK_SW', 'TREE_CAP_WALL_SW',
-        'TREE_TRUNK_SW_DEAD', 'TREE_CAP_WALL_SW_DEAD', 'TREE_TRUNK_SE',
-        'TREE_CAP_WALL_SE', 'TREE_TRUNK_SE_DEAD',
-        'TREE_CAP_WALL_SE_DEAD', 'TREE_TRUNK_NSE',
-        'TREE_TRUNK_NSE_DEAD', 'TREE_TRUNK_NSW', 'TREE_TRUNK_NSW_DEAD',
-        'TREE_TRUNK_NEW', 'TREE_TRUNK_NEW_DEAD', 'TREE_TRUNK_SEW',
-        'TREE_TRUNK_SEW_DEAD', 'TREE_TRUNK_NSEW',
-        'TREE_TRUNK_NSEW_DEAD', 'TREE_TRUNK_BRANCH_N',
-        'TREE_TRUNK_BRANCH_N_DEAD', 'TREE_TRUNK_BRANCH_S',
-        'TREE_TRUNK_BRANCH_S_DEAD', 'TREE_TRUNK_BRANCH_E',
-        'TREE_TRUNK_BRANCH_E_DEAD', 'TREE_TRUNK_BRANCH_W',
-        'TREE_TRUNK_BRANCH_W_DEAD', 'TREE_BRANCH_NS',
-        'TREE_BRANCH_NS_DEAD', 'TREE_BRANCH_EW', 'TREE_BRANCH_EW_DEAD',
-        'TREE_BRANCH_NW', 'TREE_BRANCH_NW_DEAD', 'TREE_BRANCH_NE',
-        'TREE_BRANCH_NE_DEAD', 'TREE_BRANCH_SW', 'TREE_BRANCH_SW_DEAD',
-        'TREE_BRANCH_SE', 'TREE_BRANCH_SE_DEAD', 'TREE_BRANCH_NSE',
-        'TREE_BRANCH_NSE_DEAD', 'TREE_BRANCH_NSW',
-        'TREE_BRANCH_NSW_DEAD', 'TREE_BRANCH_NEW',
-        'TREE_BRANCH_NEW_DEAD', 'TREE_BRANCH_SEW',
-        'TREE_BRANCH_SEW_DEAD', 'TREE_BRANCH_NSEW',
-        'TREE_BRANCH_NSEW_DEAD', 'TREE_TWIGS', 'TREE_TWIGS_DEAD',
-        'TREE_CAP_RAMP', 'TREE_CAP_RAMP_DEAD', 'TREE_CAP_FLOOR1',
-        'TREE_CAP_FLOOR2', 'TREE_CAP_FLOOR1_DEAD',
-        'TREE_CAP_FLOOR2_DEAD', 'TREE_CAP_FLOOR3', 'TREE_CAP_FLOOR4',
-        'TREE_CAP_FLOOR3_DEAD', 'TREE_CAP_FLOOR4_DEAD',
-        'TREE_TRUNK_INTERIOR', 'TREE_TRUNK_INTERIOR_DEAD']
     init_fields = [
-        'FONT', 'FULLFONT', 'GRAPHICS', 'GRAPHICS_FONT',
-        'GRAPHICS_FULLFONT', 'TRUETYPE', 'PRINT_MODE',
-        'GRAPHICS_BLACK_SPACE', 'TEXTURE_PARAM', 'MOUSE_PICTURE']
-    init_fields = [f for f in init_fields if lnp.settings.version_has_option(f)]
+        f for f in _INIT_FIELDS if lnp.settings.version_has_option(f)]
     d_init_fields = [
-        f for f in d_init_fields if lnp.settings.version_has_option(f)]
+        f for f in _D_INIT_FIELDS if lnp.settings.version_has_option(f)]
     init = os.path.join(gfx_dir, 'data', 'init', 'init.txt')
     if lnp.df_info.version <= '0.31.03':
         d_init = init
     else:
         d_init = os.path.join(gfx_dir, 'data', 'init', 'd_init.txt')
-    lnp.settings.read_file(init, init_fields, False)
-    lnp.settings.read_file(d_init, d_init_fields, False)
+    lnp.settings.read_files(((init, init_fields), (d_init, d_init_fields)))
     df.save_params()
 
 def simplify_graphics():
     """Removes unnecessary files from all graphics packs."""
-    for pack in read_graphics():
-        simplify_pack(pack[0])
+    # Resolve (and if needed, unpack) the baseline once, so the workers
+    # don't race to extract it; each pack is then an independent subtree.
+    baselines.find_vanilla_raws()
+    # Only touch valid packs; simplify_pack deletes everything outside its
+    # keep-list, which would gut e.g. a zip extracted with a nested folder
+    packs = (p for p in list_pack_names() if validate_pack(p))
+    with ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 4)) as pool:
+        list(pool.map(simplify_pack, packs))
 
 def simplify_pack(pack):
     """Removes unnecessary files from one graphics pack."""
@@ -289,8 +398,10 @@ def simplify_pack(pack):
 
 def savegames_to_update():
     """Returns a list of savegames that will be updated."""
-    return [o for o in glob.glob(paths.get('save', '*'))
-            if os.path.isdir(o) and not o.endswith('current')]
+    if not os.path.isdir(paths.get('save')):
+        return []
+    return [e.path for e in os.scandir(paths.get('save'))
+            if e.is_dir(follow_symlinks=False) and e.name != 'current']
 
 def update_graphics_raws(raw_dir, pack):
     """Updates raws in place for a new graphics pack.
@@ -320,12 +431,28 @@ def update_graphics_raws(raw_dir, pack):
 def update_savegames():
     """Update save games with current raws."""
     count, skipped, saves = 0, 0, savegames_to_update()
+    pack = current_pack()
+    groups = {}
     for save_raws in [paths.get('saves', s, 'raw') for s in saves]:
-        r = can_rebuild(os.path.join(save_raws, 'installed_raws.txt'))
-        if r and update_graphics_raws(save_raws, current_pack()):
-            count += 1
+        save_log = os.path.join(save_raws, 'installed_raws.txt')
+        if can_rebuild(save_log):
+            key = tuple(mods.read_installation_log(save_log))
+            groups.setdefault(key, []).append(save_raws)
         else:
             skipped += 1
+    for targets in groups.values():
+        # Merging writes to a shared temp dir and must stay serial; the
+        # first save with a given mod list performs it.  The other saves
+        # reuse the merged result, so their IO-bound copies can overlap.
+        if not update_graphics_raws(targets[0], pack):
+            skipped += len(targets)
+            continue
+        count += 1
+        if len(targets) > 1:
+            with ThreadPoolExecutor(
+                    max_workers=min(8, len(targets))) as pool:
+                count += sum(
+                    1 for _ in pool.map(mods.deploy_raw_dir, targets[1:]))
     return count, skipped
 
 def can_rebuild(log_file, strict=True):
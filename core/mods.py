@@ -3,12 +3,12 @@
 """Mod Pack management and merging tools."""
 from __future__ import print_function, unicode_literals, absolute_import
 
-import sys, os, shutil, glob, time
+import sys, os, shutil, glob, threading, time
 from difflib import ndiff, SequenceMatcher
 # pylint:disable=redefined-builtin
 from io import open
 
-from . import paths, baselines, log, manifest
+from . import paths, baselines, helpers, log, manifest
 from .lnp import lnp
 
 def _shutil_wrap(fn):
@@ -117,10 +117,10 @@ def install_mods():
     if read_installation_log(merge_log):
         shutil.rmtree(paths.get('df', 'raw'))
         shutil.rmtree(paths.get('df', 'data', 'speech'))
-        shutil.copytree(paths.get('baselines', 'temp', 'raw'),
-                        paths.get('df', 'raw'))
-        shutil.copytree(paths.get('baselines', 'temp', 'data', 'speech'),
-                        paths.get('df', 'data', 'speech'))
+        helpers.fast_copytree(paths.get('baselines', 'temp', 'raw'),
+                              paths.get('df', 'raw'))
+        helpers.fast_copytree(paths.get('baselines', 'temp', 'data', 'speech'),
+                              paths.get('df', 'data', 'speech'))
         return True
     log.w('To avoid data loss, PyLNP only installs mods if a log exists')
     return False
@@ -365,11 +365,12 @@ def clear_temp():
         return
     if os.path.exists(paths.get('baselines', 'temp')):
         shutil.rmtree(paths.get('baselines', 'temp'))
-    shutil.copytree(baselines.find_vanilla_raws(),
-                    paths.get('baselines', 'temp', 'raw'))
+    helpers.fast_copytree(baselines.find_vanilla_raws(),
+                          paths.get('baselines', 'temp', 'raw'))
     shutil.rmtree(paths.get('baselines', 'temp', 'raw', 'graphics'))
-    shutil.copytree(os.path.join(baselines.find_vanilla(), 'data', 'speech'),
-                    paths.get('baselines', 'temp', 'data', 'speech'))
+    helpers.fast_copytree(
+        os.path.join(baselines.find_vanilla(), 'data', 'speech'),
+        paths.get('baselines', 'temp', 'data', 'speech'))
     with open(paths.get('baselines', 'temp', 'raw', 'installed_raws.txt'),
               'w') as f:
         f.write('# List of raws merged by PyLNP:\nbaselines/' +
@@ -393,8 +394,22 @@ def update_raw_dir(path, gfx=('', '')):
         if -1 in merge_all_mods(mods_list, gfx[0]):
             log.w('Some mods in {} could not be remerged'.format(path))
             return False
-    shutil.rmtree(path)
-    shutil.copytree(paths.get('baselines', 'temp', 'raw'), path)
+    return deploy_raw_dir(path)
+
+def deploy_raw_dir(path):
+    """Replaces a raw dir with the merged raws in baselines/temp/raw.
+    Unlike the merge itself, this is safe to run for several dirs at once."""
+    old = path + '.old'
+    if os.path.isdir(old):
+        shutil.rmtree(old, ignore_errors=True)
+    # Renaming the old tree aside is O(1); deleting it is O(files) of pure
+    # wait, so overlap the delete with the copy into the now-free path.
+    os.rename(path, old)
+    remover = threading.Thread(
+        target=shutil.rmtree, args=(old,), kwargs={'ignore_errors': True})
+    remover.start()
+    helpers.fast_copytree(paths.get('baselines', 'temp', 'raw'), path)
+    remover.join()
     return True
 
 def add_graphics(gfx):
@@ -434,7 +449,11 @@ def make_mod_from_installed_raws(name):
         for mod in get_installed_mods_from_log():
             merge_a_mod(mod)
         reconstruction = paths.get('baselines', 'temp2')
-        shutil.copytree(paths.get('baselines', 'temp'), reconstruction)
+        if os.path.isdir(reconstruction):
+            shutil.rmtree(reconstruction)
+        # clear_temp() below rebuilds temp anyway, so a same-device rename
+        # moves the whole tree without copying a single byte
+        shutil.move(paths.get('baselines', 'temp'), reconstruction)
     else:
         reconstruction = baselines.find_vanilla()
         if not reconstruction:
@@ -454,7 +473,8 @@ def make_mod_from_installed_raws(name):
     if name and os.path.isdir(paths.get('baselines', 'temp')):
         if os.path.isdir(paths.get('mods', name)):
             return False
-        shutil.copytree(paths.get('baselines', 'temp'), paths.get('mods', name))
+        helpers.fast_copytree(
+            paths.get('baselines', 'temp'), paths.get('mods', name))
         return True
 
 def get_installed_mods_from_log():
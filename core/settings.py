@@ -4,6 +4,9 @@
 from __future__ import print_function, unicode_literals, absolute_import
 
 import sys, os, re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from .dfraw import DFRaw
 from . import log, hacks
 
@@ -12,7 +15,7 @@ if sys.version_info[0] == 3:
     basestring = str
 
 # Markers to read certain settings correctly
-# pylint:disable=too-few-public-methods,too-many-instance-attributes,too-many-statements,too-many-arguments
+# pylint:disable=too-few-public-methods,too-many-instance-attributes,too-many-statements,too-many-arguments,too-many-lines
 class _DisableValues(object):
     """Marker class for DFConfiguration. Value is disabled by replacing [ and ]
     with !."""
@@ -33,6 +36,9 @@ class _AnnouncementFocus(object):
 
 _announcement_focus = _AnnouncementFocus()
 
+# Flips YES/NO for _negated_bool options without building throwaway lists
+_negate = {"YES": "NO", "NO": "YES"}
+
 # Format: Key = tag name, value = list of version numbers
 # First value indicates first version with the tag
 # Second value, if present, indicates first version WITHOUT the tag
@@ -344,6 +350,109 @@ _option_version_data = {
     'GUILDHALL_VALUE_LEVELS': ['0.47.01'],
 }
 
+def _version_data(version):
+    """Parses a version string into the comparable tuple used by
+    df.Version (duplicated here because importing df would be circular)."""
+    s = ""
+    data = []
+    for c in version:
+        if c < '0' or c > '9':
+            data.append(int(s))
+            if c != '.':
+                data.append(c)
+            s = ""
+        else:
+            s = s + c
+    if s != '':
+        data.append(int(s))
+    return tuple(data)
+
+# Pre-split the version data into (added, removed) bounds at import, so
+# version_has_option is a plain lookup with no per-call branching on length.
+# Bounds are stored as tuples; comparing those is both faster and more
+# correct than lexical string ordering (e.g. '0.31.13' vs '0.31.2').
+_option_version_bounds = dict(
+    (tag, (_version_data(vs[0]),
+           _version_data(vs[1]) if len(vs) == 2 else None))
+    for tag, vs in _option_version_data.items())
+
+# Matches [NAME:VALUE] and bare [NAME] tags as well as disabled !NAME! tags,
+# so a whole file can be indexed in one pass instead of rescanned per field.
+# The three tag forms use separate groups so findall can hand back plain
+# string tuples and the loop below never touches a match object.
+_token_pattern = re.compile(
+    r'\[([^\[\]:\n]+):([^\[\]\n]*)\]|\[([^\[\]:\n]+)\]|!(\w+)!')
+
+def _parse_tags(text):
+    """Tokenizes <text> in a single pass, mapping each tag name to the value
+    string of its first ``[NAME:VALUE]`` occurrence, ``True`` if any bare
+    ``[NAME]`` tag appears, or ``False`` if only disabled ``!NAME!`` tags do.
+    Merged raw files legitimately mix both flag forms; an enabled tag
+    anywhere means the option is enabled, matching the old substring test."""
+    tags = {}
+    setdefault = tags.setdefault
+    get = tags.get
+    for name, value, flag, disabled in _token_pattern.findall(text):
+        if name:
+            setdefault(name, value)
+        elif flag:
+            if get(flag, False) is False:
+                tags[flag] = True
+        else:
+            setdefault(disabled, False)
+    return tags
+
+# In-memory cache of parsed settings files, keyed on absolute path and
+# invalidated by mtime so our own writes and external edits are both noticed
+_file_cache = {}
+
+def _read_tags(filename):
+    """Returns (text, tags) for <filename>, reusing a cached copy as long as
+    the file is unchanged on disk since it was last parsed."""
+    key = os.path.abspath(filename)
+    mtime = os.stat(key).st_mtime_ns
+    cached = _file_cache.get(key)
+    if cached is not None and cached[0] == mtime:
+        return cached[1], cached[2]
+    text = DFRaw.read(filename)
+    tags = _parse_tags(text)
+    _file_cache[key] = (mtime, text, tags)
+    return text, tags
+
+def _drop_cached_file(filename):
+    """Forgets the cached copy of <filename> after a write; on filesystems
+    with coarse timestamps the mtime alone may not change."""
+    _file_cache.pop(os.path.abspath(filename), None)
+
+@lru_cache(maxsize=512)
+def _params_pattern(field_name):
+    """Returns a compiled pattern capturing the :-prefixed parameters of
+    [<field_name>:...] tags, as used by has_field."""
+    return re.compile(r'\[' + re.escape(field_name) + r'(:.+?)\]')
+
+def _make_value_reader(values):
+    """Picks the file-to-setting value transform for an option kind once at
+    registration, so the read path does not re-test marker identity per
+    field. Returns None when the value is stored as-is."""
+    if values is _negated_bool:
+        return _negate.__getitem__
+    if values is _announcement_focus:
+        def read_focus(value):
+            """YES when both the P and R flags are present."""
+            flags = value.split(':')
+            return "YES" if "P" in flags and "R" in flags else "NO"
+        return read_focus
+    return None
+
+def _make_value_writer(values):
+    """Counterpart of _make_value_reader for the setting-to-file
+    direction."""
+    if values is _negated_bool:
+        return _negate.__getitem__
+    if values is _announcement_focus:
+        return lambda value: "P:R" if value == "YES" else ""
+    return None
+
 def _option_item_to_value(item):
     """Removes any validation expression from <item>."""
     if not isinstance(item, basestring):
@@ -365,11 +474,19 @@ class DFConfiguration(object):
         self.field_names = dict()
         self.inverse_field_names = dict()
         self.files = dict()
-        self.in_files = dict()
-        self.missing_fields = []
+        self.in_files = defaultdict(list)
+        self._files_intern = dict()
+        self._grouped_fields = None
+        self.missing_fields = set()
+        self._readers = dict()
+        self._writers = dict()
+        self._tokens = dict()
+        self._vho_cache = dict()
         self.validate = dict()
 
         self.df_info = df_info
+        # Interned once; version_has_option compares tuples, not strings
+        self._version_data = df_info.version.data
         # init.txt
         boolvals = ("YES", "NO")
         init = (os.path.join(base_dir, 'data', 'init', 'init.txt'),)
@@ -516,15 +633,21 @@ class DFConfiguration(object):
         self.validate[name] = validate
         self.settings[name] = default
         self.options[name] = values
+        self._readers[name] = _make_value_reader(values)
+        self._writers[name] = _make_value_writer(values)
+        self._tokens[name] = (
+            '[{0}]'.format(field_name), '!{0}!'.format(field_name))
         if field_name != name:
             self.inverse_field_names[field_name] = name
+        # Identical filesets share one tuple, so later passes over in_files
+        # hash each distinct fileset only once
+        files = self._files_intern.setdefault(files, files)
         self.files[name] = files
-        self.in_files.setdefault(files, [])
         self.in_files[files].append(name)
+        self._grouped_fields = None
 
     def __iter__(self):
-        for key, value in list(self.settings.items()):
-            yield key, value
+        return iter(self.settings.items())
 
     def set_value(self, name, value):
         """
@@ -635,15 +758,60 @@ class DFConfiguration(object):
                         current[0], fn, current[2]))
         return errors
 
+    def _fields_by_file(self):
+        """Groups the registered options by the individual files they live
+        in, so each file is visited exactly once per read/write pass even
+        when filesets overlap. The grouping is cached until the next
+        registration, since read and write passes far outnumber those."""
+        if self._grouped_fields is not None:
+            return self._grouped_fields
+        grouped = dict()
+        for files, fields in self.in_files.items():
+            auto_add = len(files) == 1 and files[0].endswith('init.txt')
+            for filename in files:
+                entry = grouped.setdefault(filename, [[], False])
+                entry[0].extend(fields)
+                entry[1] = entry[1] or auto_add
+        self._grouped_fields = grouped
+        return grouped
+
     def read_settings(self):
         """Read settings from known filesets. If fileset only contains one
         file ending with "init.txt", all options will be registered
         automatically."""
-        for files in self.in_files:
-            for filename in files:
-                self.read_file(
-                    filename, self.in_files[files],
-                    len(files) == 1 and files[0].endswith('init.txt'))
+        grouped = self._fields_by_file()
+        if len(grouped) > 1:
+            # Warm the file cache concurrently - the GIL is released
+            # while reading - then parse from memory in a stable order.
+            # Missing files are reported by read_file below, as before.
+            def prefetch(filename):
+                """Loads one file into the cache, ignoring errors."""
+                try:
+                    _read_tags(filename)
+                except EnvironmentError:
+                    pass
+            with ThreadPoolExecutor(max_workers=4) as pool:
+                for _ in pool.map(prefetch, grouped):
+                    pass
+        for filename, (fields, auto_add) in grouped.items():
+            self.read_file(filename, fields, auto_add)
+
+    def read_files(self, file_fields, auto_add=False):
+        """
+        Reads DF settings from several files, opening each file only once
+        even if it is listed repeatedly (e.g. init.txt doubling as d_init.txt
+        before DF 0.31.04).
+
+        Args:
+            file_fields: an iterable of (filename, fields) pairs.
+            auto_add: whether to automatically register all unknown fields for
+                changes.
+        """
+        grouped = dict()
+        for filename, fields in file_fields:
+            grouped.setdefault(filename, []).extend(fields)
+        for filename, fields in grouped.items():
+            self.read_file(filename, fields, auto_add)
 
     def read_file(self, filename, fields, auto_add):
         """
@@ -656,36 +824,31 @@ class DFConfiguration(object):
               changes.
         """
         #pylint:disable=too-many-branches
-        text = DFRaw.read(filename)
+        tags = _read_tags(filename)[1]
         if auto_add:
-            for match in re.findall(r'\[(.+?):(.+?)\]', text):
-                self.create_option(
-                    match[0], match[0], match[1], None, (filename,))
+            for name, value in tags.items():
+                if isinstance(value, basestring):
+                    self.create_option(name, name, value, None, (filename,))
+        # Callers like graphics.patch_inits pass file-side names; normalize
+        # them in one sweep instead of double-hashing inside the loop
+        fields = [self.inverse_field_names.get(f, f) for f in fields]
         for field in fields:
-            if field in self.inverse_field_names:
-                field = self.inverse_field_names[field]
+            field_name = self.field_names[field]
             if self.options[field] is _disabled:
-                # If there is a single match, flag the option as enabled
-                if "[{0}]".format(self.field_names[field]) in text:
+                # A bare [NAME] tag flags the option as enabled
+                if tags.get(field_name) is True:
                     self.settings[field] = "YES"
             else:
-                match = re.search(r'\[{0}:(.+?)\]'.format(
-                    self.field_names[field]), text)
-                if match:
-                    value = match.group(1)
-                    if self.options[field] is _negated_bool:
-                        value = ["YES", "NO"][["NO", "YES"].index(value)]
-                    elif self.options[field] is _announcement_focus:
-                        values = value.split(':')
-                        if 'P' in values and 'R' in values:
-                            value = "YES"
-                        else:
-                            value = "NO"
+                value = tags.get(field_name)
+                if isinstance(value, basestring):
+                    reader = self._readers[field]
+                    if reader is not None:
+                        value = reader(value)
                     self.settings[field] = value
                 else:
-                    self.missing_fields.append(self.field_names[field])
+                    self.missing_fields.add(field_name)
                     log.w(
-                        'Field ' + str(self.field_names[field]) +
+                        'Field ' + str(field_name) +
                         ' seems to be missing from file ' + str(filename) +
                         '!', file=sys.stderr)
 
@@ -705,9 +868,15 @@ class DFConfiguration(object):
             max_params: the maximum number of parameters for the field.
                 -1 for no limit.
         """
+        #pylint:disable=too-many-return-statements
+        field = str(field)
         try:
-            match = re.search(
-                r'\['+str(field)+r'(:.+?)\]', DFRaw.read(filename))
+            text = _read_tags(filename)[0]
+            # C-level substring check first; the vast common case is that
+            # the field does not appear in the file at all
+            if '[' + field not in text:
+                return False
+            match = _params_pattern(field).search(text)
             if match is None:
                 return False
             params = match.group(1)
@@ -724,9 +893,8 @@ class DFConfiguration(object):
 
     def write_settings(self):
         """Write all settings to their respective files."""
-        for files in self.in_files:
-            for filename in files:
-                self.update_file(filename, self.in_files[files])
+        for filename, (fields, _) in self._fields_by_file().items():
+            self.update_file(filename, fields)
 
     def update_file(self, filename, fields):
         """
@@ -736,11 +904,19 @@ class DFConfiguration(object):
             filename: name of the file to write.
             fields: list of all field names to change.
         """
+        if self._file_is_current(filename, fields):
+            return
         with DFRaw(filename) as raw:
+            # One walk of the node tree indexes every tag, instead of a
+            # full recursive find_first/find_all per field
+            index = {}
+            for node in raw.elements:
+                index.setdefault(node.name, []).append(node)
             for field in fields:
                 field_name = self.field_names[field]
+                nodes = index.get(field_name, ())
                 if self.options[field] is _announcement_focus:
-                    node = raw.find_first(field_name)
+                    node = nodes[0]
                     values = node.values
                     if "P" in values:
                         values.remove("P")
@@ -751,12 +927,43 @@ class DFConfiguration(object):
                         values.append("R")
                     node.value = values
                 elif self.options[field] is _disabled:
-                    raw.set_all(field_name, self.settings[field] != "NO")
+                    for node in nodes:
+                        node.value = self.settings[field] != "NO"
                 else:
                     value = self.settings[field]
-                    if self.options[field] is _negated_bool:
-                        value = ["YES", "NO"][["NO", "YES"].index(value)]
-                    raw.set_value(field_name, value)
+                    writer = self._writers[field]
+                    if writer is not None:
+                        value = writer(value)
+                    if nodes:
+                        nodes[0].value = value
+        _drop_cached_file(filename)
+
+    def _file_is_current(self, filename, fields):
+        """Returns True if <filename> already reflects the stored settings
+        for every field in <fields>, so a write pass can skip parsing and
+        rewriting it. Anything ambiguous counts as out of date."""
+        try:
+            text, tags = _read_tags(filename)
+        except EnvironmentError:
+            return False
+        for field in fields:
+            value = tags.get(self.field_names[field])
+            if self.options[field] is _disabled:
+                if not isinstance(value, bool):
+                    return False
+                on, off = self._tokens[field]
+                if on in text and off in text:
+                    # Mixed forms; update_file rewrites every occurrence
+                    return False
+                current = "YES" if value else "NO"
+            elif isinstance(value, basestring):
+                reader = self._readers[field]
+                current = reader(value) if reader is not None else value
+            else:
+                return False
+            if current != self.settings[field]:
+                return False
+        return True
 
     def create_file(self, filename, fields):
         """
@@ -766,21 +973,20 @@ class DFConfiguration(object):
             filename: name of the file to write.
             fields: list of all field names to write.
         """
+        lines = []
+        for field in fields:
+            if self.options[field] is _disabled:
+                on, off = self._tokens[field]
+                lines.append(off if self.settings[field] == "NO" else on)
+            else:
+                value = self.settings[field]
+                writer = self._writers[field]
+                if writer is not None:
+                    value = writer(value)
+                lines.append('[' + field + ':' + value + ']')
         with DFRaw.open(filename, 'wt') as newfile:
-            for field in fields:
-                if self.options[field] is _disabled:
-                    if self.settings[field] == "NO":
-                        text = "!{0}!"
-                    else:
-                        text = "[{0}]"
-                    newfile.write(text.format(self.field_names[field])+'\n')
-                else:
-                    value = self.settings[field]
-                    if self.options[field] is _negated_bool:
-                        value = ["YES", "NO"][["NO", "YES"].index(value)]
-                    elif self.options[field] is _announcement_focus:
-                        value = "P:R" if value == "YES" else ""
-                    newfile.write('[' + field + ':' + value + ']\n')
+            newfile.write('\n'.join(lines) + '\n')
+        _drop_cached_file(filename)
 
     def version_has_option(self, option_name):
         """Returns True if <option_name> exists in the current DF version."""
@@ -789,18 +995,29 @@ class DFConfiguration(object):
         if option_name in self.missing_fields:
             # Field was missing when expected, pretend it doesn't exist yet
             return False
-        if option_name[0] == option_name.lower()[0]:
+        # The version is fixed per instance, so everything below memoizes;
+        # only the missing_fields check above can change over time
+        cached = self._vho_cache.get(option_name)
+        if cached is not None:
+            return cached
+        result = self._compute_version_has_option(option_name)
+        self._vho_cache[option_name] = result
+        return result
+
+    def _compute_version_has_option(self, option_name):
+        """Uncached version check backing version_has_option."""
+        if not option_name[0].isupper():
             # Internal name, let it pass by
             return True
-        if option_name not in _option_version_data:
+        bounds = _option_version_bounds.get(option_name)
+        if bounds is None:
             log.w("Unknown option: %s", option_name)
             # Unknown option, must be a later DF than this knows about
             return False
-        option = _option_version_data[option_name]
-        if len(option) == 2:
-            return option[0] <= self.df_info.version < option[1]
-        else:
-            return option[0] <= self.df_info.version
+        added, removed = bounds
+        if removed is not None:
+            return added <= self._version_data < removed
+        return added <= self._version_data
 
     def __str__(self):
         return (
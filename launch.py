@@ -3,6 +3,12 @@
 """This file is used to launch the program."""
 from __future__ import absolute_import, print_function
 import sys, os
+
+if sys.version_info < (3, 8):
+    sys.exit(
+        'PyLNP requires Python 3.8 or later; this is Python {0}.{1}'.format(
+            sys.version_info[0], sys.version_info[1]))
+
 from core import lnp
 sys.path.insert(0, os.path.dirname(__file__))
 #pylint: disable=redefined-builtin, bare-except